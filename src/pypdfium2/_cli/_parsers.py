@@ -87,8 +87,9 @@ class input_maker:
         elif inmode is InputMode.BUFFER:
             input = input.open("rb")
         elif inmode is InputMode.MMAP:
-            fh = input.open("r+b")
-            input = mmap.mmap(fh.fileno(), 0)
+            # read-only mapping - we never write, so don't make the kernel set up writable, dirty-tracked pages
+            fh = input.open("rb")
+            input = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
         elif inmode is InputMode.CTYPES:
             buffer = input.open("rb")
             size = buffer.seek(0, os.SEEK_END)
@@ -160,12 +161,12 @@ def parse_numtext(numtext):
 
 
 def round_list(lst, n_digits):
+    # NOTE the sequences passed here are tiny (2-4 coordinates), so a plain round() comprehension beats vectorization - numpy's per-call overhead would dominate at this size
     if not lst:
         return lst
-    result = [round(v, n_digits) for v in lst]
     if isinstance(lst, tuple):
-        result = tuple(result)
-    return result
+        return tuple( [round(v, n_digits) for v in lst] )
+    return [round(v, n_digits) for v in lst]
 
 
 def add_n_digits(parser):
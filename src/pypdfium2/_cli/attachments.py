@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 geisserml <geisserml@gmail.com>
 # SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
 
+import ctypes
 from pathlib import Path
 # CONSIDER dotted access
 from pypdfium2._cli._parsers import (
@@ -80,7 +81,11 @@ def main(args):
         if args.add_files:
             for fp in args.add_files:
                 attachment = pdf.new_attachment(fp.name)
-                attachment.set_data( fp.read_bytes() )
+                # read straight into a ctypes buffer, saving the intermediate bytes object of read_bytes()
+                buffer = (ctypes.c_ubyte * fp.stat().st_size)()
+                with fp.open("rb") as fh:
+                    fh.readinto(buffer)
+                attachment.set_data(buffer)
         
         pdf.save(args.output)
     
@@ -3,8 +3,7 @@
 
 # TODO test-confirm filter and info params
 
-from collections import OrderedDict
-import pypdfium2._helpers as pdfium
+import sys
 import pypdfium2.internal as pdfium_i
 import pypdfium2.raw as pdfium_r
 # CONSIDER dotted access
@@ -51,21 +50,20 @@ def attach(parser):
     )
 
 
-def print_img_metadata(m, n_digits, pad=""):
-    
-    members = OrderedDict(
-        width = m.width,
-        height = m.height,
-        horizontal_dpi = round(m.horizontal_dpi, n_digits),
-        vertical_dpi = round(m.vertical_dpi, n_digits),
-        bits_per_pixel = m.bits_per_pixel,
-        colorspace = pdfium_i.ColorspaceToStr.get(m.colorspace),
+def append_img_metadata(m, out, n_digits, pad=""):
+
+    # the attribute set is fixed, so emit one pre-shaped string per metadata struct, rather than building a dict and looping over its items
+
+    out.append(
+        f"{pad}width: {m.width}\n"
+        f"{pad}height: {m.height}\n"
+        f"{pad}horizontal_dpi: {round(m.horizontal_dpi, n_digits)}\n"
+        f"{pad}vertical_dpi: {round(m.vertical_dpi, n_digits)}\n"
+        f"{pad}bits_per_pixel: {m.bits_per_pixel}\n"
+        f"{pad}colorspace: {pdfium_i.ColorspaceToStr.get(m.colorspace)}\n"
     )
     if m.marked_content_id != -1:
-        members["marked_content_id"] = m.marked_content_id
-    
-    for key, value in members.items():
-        print(pad + f"{key}: {value}")
+        out.append(f"{pad}marked_content_id: {m.marked_content_id}\n")
 
 
 def main(args):
@@ -79,39 +77,59 @@ def main(args):
     show_pos = (PARAM_POS in args.info)
     show_imageinfo = (PARAM_IMGINFO in args.info)
     total_count = 0
-    
+
+    # hoist repeated attribute lookups to locals, and memoize the indentation strings - this loop is hot for object-heavy documents
+    type_to_str = pdfium_i.ObjectTypeToStr.get
+    n_digits = args.n_digits
+    # memoize the pads for the first levels only: level 0 and its child pad must exist even for
+    # max_depth <= 0 (get_objects() always yields top-level objects), while a huge --max-depth
+    # means "unlimited" and must not allocate a quadratic-size table up front
+    pads = ["    " * i for i in range(min(max(args.max_depth, 1), 64) + 1)]
+    img_type = pdfium_r.FPDF_PAGEOBJ_IMAGE
+    quad_types = (img_type, pdfium_r.FPDF_PAGEOBJ_TEXT)
+
     for i in args.pages:
-        
+
         page = pdf[i]
         obj_searcher = page.get_objects(args.filter, max_depth=args.max_depth)
         preamble = f"# Page {i+1}\n"
         count = 0
-        
+
+        # collect the page's output and emit it in one write, rather than one locking/flushing print() call per line
+        out = []
+
         for obj in obj_searcher:
-            
-            pad_0 = "    " * obj.level
-            pad_1 = pad_0 + "    "
-            print(preamble + pad_0 + pdfium_i.ObjectTypeToStr.get(obj.type))
-            
+
+            if obj.level + 1 < len(pads):
+                pad_0, pad_1 = pads[obj.level], pads[obj.level + 1]
+            else:  # deeper than the memoized table - compute on demand
+                pad_0 = "    " * obj.level
+                pad_1 = pad_0 + "    "
+            out.append(preamble + pad_0 + type_to_str(obj.type) + "\n")
+
             if show_pos:
-                bounds = round_list(obj.get_bounds(), args.n_digits)
-                print(pad_1 + f"Bounding Box: {bounds}")
-                if obj.type in (pdfium_r.FPDF_PAGEOBJ_IMAGE, pdfium_r.FPDF_PAGEOBJ_TEXT):
+                bounds = round_list(obj.get_bounds(), n_digits)
+                out.append(pad_1 + f"Bounding Box: {bounds}\n")
+                if obj.type in quad_types:
                     quad_bounds = obj.get_quad_points()
-                    print(pad_1 + f"Quad Points: {[round_list(p, args.n_digits) for p in quad_bounds]}")
-            
-            if show_imageinfo and isinstance(obj, pdfium.PdfImage):
-                print(pad_1 + f"Filters: {obj.get_filters()}")
+                    out.append(pad_1 + f"Quad Points: {[round_list(p, n_digits) for p in quad_bounds]}\n")
+
+            # type comparison rather than isinstance() - image metadata is a property of the object type, and int compare avoids the MRO walk
+            if show_imageinfo and obj.type == img_type:
+                out.append(pad_1 + f"Filters: {obj.get_filters()}\n")
                 metadata = obj.get_metadata()
                 assert (metadata.width, metadata.height) == obj.get_px_size()
-                print_img_metadata(metadata, args.n_digits, pad=pad_1)
-            
+                append_img_metadata(metadata, out, n_digits, pad=pad_1)
+
             count += 1
             preamble = ""
-        
+
         if count > 0:
-            print(f"-> Count: {count}\n")
+            out.append(f"-> Count: {count}\n\n")
             total_count += count
-    
+
+        sys.stdout.write( "".join(out) )
+
     if total_count > 0:
-        print(f"-> Total count: {total_count}")
+        sys.stdout.write(f"-> Total count: {total_count}\n")
+    sys.stdout.flush()
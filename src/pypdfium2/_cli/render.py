@@ -10,6 +10,7 @@ import functools
 from pathlib import Path
 import multiprocessing as mp
 import concurrent.futures as ft
+from multiprocessing.shared_memory import SharedMemory
 
 import PIL.Image
 import PIL.ImageFilter
@@ -297,6 +298,18 @@ class PILReceiver (SavingReceiver):
         return out_image
 
 
+class _shm_input:
+
+    # Callable input adapter that ships only the block name through pickle.
+    # Each worker attaches to the existing shared memory, instead of receiving its own copy of the PDF bytes.
+
+    def __init__(self, name):
+        self._name = name
+
+    def __call__(self):
+        return SharedMemory(name=self._name)
+
+
 def _render_parallel_init(extra_init, input, password, may_init_forms, kwargs, receiver, receiver_kwargs):
     
     if extra_init:
@@ -330,7 +343,8 @@ def main(args):
     
     # TODO move to parsers?
     pdf_len = len(pdf)
-    if not all(0 <= i < pdf_len for i in args.pages):
+    # min/max are C-level scans, as opposed to a python generator loop with all()
+    if args.pages and not (min(args.pages) >= 0 and max(args.pages) < pdf_len):
         raise ValueError("Out-of-bounds page indices are prohibited.")
     if len(args.pages) != len(set(args.pages)):
         raise ValueError("Duplicate page indices are prohibited.")
@@ -392,26 +406,40 @@ def main(args):
         
         ctx = mp.get_context(args.parallel_strategy)
         # TODO unify using mp.pool.Pool(context=...) ?
+        # jobs are independent (each saves its own file), so unordered iteration avoids head-of-line blocking on slow pages
         pool_backends = dict(
-            mp = (ctx.Pool, "imap"),
+            mp = (ctx.Pool, "imap_unordered"),
             ft = (functools.partial(ft.ProcessPoolExecutor, mp_context=ctx), "map"),
         )
         pool_ctor, map_attr = pool_backends[args.parallel_lib]
         if args.parallel_map:
             map_attr = args.parallel_map
         
+        # for bytes-like input, copy once into shared memory and pass only the name to workers, rather than pickling the whole blob per worker
+        worker_input, shm = pdf._orig_input, None
+        if isinstance(worker_input, (bytes, bytearray)):
+            shm = SharedMemory(create=True, size=len(worker_input))
+            shm.buf[:len(worker_input)] = worker_input
+            worker_input = _shm_input(shm.name)
+
         extra_init = (setup_logging if args.parallel_strategy in ("spawn", "forkserver") else None)
         pool_kwargs = dict(
             initializer = _render_parallel_init,
-            initargs = (extra_init, pdf._orig_input, args.password, may_draw_forms, kwargs, receiver, receiver_kwargs),
+            initargs = (extra_init, worker_input, args.password, may_draw_forms, kwargs, receiver, receiver_kwargs),
         )
         
         n_procs = min(args.processes, len(args.pages))
-        with pool_ctor(n_procs, **pool_kwargs) as pool:
-            map_func = getattr(pool, map_attr)
-            for _ in map_func(_render_parallel_job, args.pages):
-                pass
-        
-        # For shared memory, we must keep the pdf alive up to this point, since it manages input lifetime
-        # TODO consider outsourcing input to caller side
-        pdf.close()
+        # batch the page indices so we don't pay one IPC round trip per page; a few chunks per worker keeps the load balanced
+        chunksize = max(1, len(args.pages) // (n_procs * 4))
+        try:
+            with pool_ctor(n_procs, **pool_kwargs) as pool:
+                map_func = getattr(pool, map_attr)
+                for _ in map_func(_render_parallel_job, args.pages, chunksize=chunksize):
+                    pass
+        finally:
+            # For shared memory, we must keep the pdf alive up to this point, since it manages input lifetime
+            # TODO consider outsourcing input to caller side
+            pdf.close()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
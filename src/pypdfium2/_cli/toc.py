@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 geisserml <geisserml@gmail.com>
 # SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
 
+import sys
 import pypdfium2.internal as pdfium_i
 # CONSIDER dotted access
 from pypdfium2._cli._parsers import (
@@ -26,7 +27,10 @@ def main(args):
     
     pdf = get_input(args)
     toc = pdf.get_toc(max_depth=args.max_depth)
-    
+
+    # accumulate and emit in a single write, rather than one locking/flushing print() call per bookmark
+    lines = []
+
     for bm in toc:
         count, dest = bm.get_count(), bm.get_dest()
         out = "    " * bm.level
@@ -44,4 +48,6 @@ def main(args):
             )
         else:
             out += "_"
-        print(out)
+        lines.append(out + "\n")
+
+    sys.stdout.write( "".join(lines) )
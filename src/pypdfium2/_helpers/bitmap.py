@@ -12,15 +12,7 @@ from pypdfium2._helpers.misc import PdfiumError
 
 logger = logging.getLogger(__name__)
 
-try:
-    import PIL.Image
-except ImportError:
-    PIL = None
-
-try:
-    import numpy
-except ImportError:
-    numpy = None
+# PIL and numpy are optional and fairly heavy - they are imported on demand in the respective converters, so merely importing pypdfium2 does not pay their load cost
 
 
 class PdfBitmap (pdfium_i.AutoCloseable):
@@ -210,7 +202,9 @@ class PdfBitmap (pdfium_i.AutoCloseable):
         """
         
         # https://numpy.org/doc/stable/reference/generated/numpy.ndarray.html#numpy.ndarray
-        
+
+        import numpy
+
         array = numpy.ndarray(
             # layout: row major
             shape = (self.height, self.width, self.n_channels),
@@ -237,7 +231,9 @@ class PdfBitmap (pdfium_i.AutoCloseable):
         
         # https://pillow.readthedocs.io/en/stable/reference/Image.html#PIL.Image.frombuffer
         # https://pillow.readthedocs.io/en/stable/handbook/writing-your-own-image-plugin.html#the-raw-decoder
-        
+
+        import PIL.Image
+
         dest_mode = pdfium_i.BitmapTypeToStrReverse[self.format]
         image = PIL.Image.frombuffer(
             dest_mode,                  # target color format
@@ -285,9 +281,11 @@ class PdfBitmap (pdfium_i.AutoCloseable):
 
 
 def _pil_convert_for_pdfium(pil_image):
-    
+
     # FIXME? convoluted / hard to understand; improve control flow
-    
+
+    import PIL.Image
+
     if pil_image.mode == "1":
         pil_image = pil_image.convert("L")
     elif pil_image.mode.startswith("RGB"):
@@ -49,7 +49,12 @@ class PdfDocument (pdfium_i.AutoCloseable):
         autoclose (bool):
             Whether byte buffer input should be automatically closed on finalization.
             If True and the input is shared memory, it will be closed but not destroyed.
-        
+
+        cache_pages (bool):
+            If True, cache the page count and page helper objects, so that repeated access does not translate into redundant PDFium calls.
+            The cache is invalidated by the mutating helper methods (:meth:`.new_page`, :meth:`.del_page`, :meth:`.import_pages`),
+            but not if the document is modified through the raw API, so only opt in if you do not mutate pages at that level.
+
     Raises:
         PdfiumError: Raised if the document failed to load. The exception message is annotated with the reason reported by PDFium.
         FileNotFoundError: Raised if an invalid or non-existent file path was given.
@@ -67,14 +72,17 @@ class PdfDocument (pdfium_i.AutoCloseable):
             Form env, if :meth:`.init_forms` was called and the document has forms.
     """
     
-    def __init__(self, input, password=None, autoclose=False):
-        
+    def __init__(self, input, password=None, autoclose=False, cache_pages=False):
+
         # CONSIDER adding a public method to inject into data_holder/data_closer
-        
+
         self._orig_input = input
         self._autoclose = autoclose
         self._data_holder = []
         self._data_closer = []
+        self._cache_pages = cache_pages
+        self._page_cache = {}
+        self._n_pages = None
         
         self._input, to_close = _preprocess_input(self._orig_input)
         if autoclose:
@@ -127,7 +135,15 @@ class PdfDocument (pdfium_i.AutoCloseable):
     
     
     def __len__(self):
-        return pdfium_r.FPDF_GetPageCount(self)
+        if not self._cache_pages:
+            return pdfium_r.FPDF_GetPageCount(self)
+        if self._n_pages is None:
+            self._n_pages = pdfium_r.FPDF_GetPageCount(self)
+        return self._n_pages
+
+    def _invalidate_page_cache(self):
+        self._n_pages = None
+        self._page_cache.clear()
     
     def __iter__(self):
         for i in range( len(self) ):
@@ -293,6 +309,8 @@ class PdfDocument (pdfium_i.AutoCloseable):
         """
         enc_key = (key + "\x00").encode("utf-8")
         n_bytes = pdfium_r.FPDF_GetMetaText(self, enc_key, None, 0)
+        if n_bytes <= 2:  # just the null terminator - skip the second call for absent/empty keys
+            return ""
         buffer = ctypes.create_string_buffer(n_bytes)
         pdfium_r.FPDF_GetMetaText(self, enc_key, buffer, n_bytes)
         return buffer.raw[:n_bytes-2].decode("utf-16-le")
@@ -377,7 +395,12 @@ class PdfDocument (pdfium_i.AutoCloseable):
             This calls ``FORM_OnAfterLoadPage()`` if the document has an active form env.
             The form env must not be closed before the page is closed!
         """
-        
+
+        if self._cache_pages:
+            page = self._page_cache.get(index)
+            if page and page.raw:  # may have been closed by the caller in the meantime
+                return page
+
         raw_page = pdfium_r.FPDF_LoadPage(self, index)
         if not raw_page:
             raise PdfiumError("Failed to load page.")
@@ -388,7 +411,10 @@ class PdfDocument (pdfium_i.AutoCloseable):
             self.formenv._add_kid(page)
         else:
             self._add_kid(page)
-        
+
+        if self._cache_pages:
+            self._page_cache[index] = page
+
         return page
     
     
@@ -413,6 +439,7 @@ class PdfDocument (pdfium_i.AutoCloseable):
         page = PdfPage(raw_page, self, None)
         # not doing formenv calls for new pages as it does not seem necessary
         self._add_kid(page)
+        self._invalidate_page_cache()
         return page
     
     
@@ -422,6 +449,7 @@ class PdfDocument (pdfium_i.AutoCloseable):
         """
         # FIXME what if the caller still has a handle to the page?
         pdfium_r.FPDFPage_Delete(self, index)
+        self._invalidate_page_cache()
     
     
     def import_pages(self, pdf, pages=None, index=None):
@@ -453,6 +481,8 @@ class PdfDocument (pdfium_i.AutoCloseable):
         
         if not ok:
             raise PdfiumError("Failed to import pages.")
+
+        self._invalidate_page_cache()
     
     
     def get_page_size(self, index):
@@ -503,40 +533,56 @@ class PdfDocument (pdfium_i.AutoCloseable):
             self,
             max_depth = 15,
             parent = None,
-            level = 0,
-            seen = None,
         ):
         """
         Iterate through the bookmarks in the document's table of contents (TOC).
-        
+
         Parameters:
             max_depth (int):
                 Maximum recursion depth to consider.
         Yields:
             :class:`.PdfBookmark`
         """
-        
+
         # CONSIDER warn if max_depth reached?
-        
-        if seen is None:
-            seen = set()
-        
-        bookmark_ptr = pdfium_r.FPDFBookmark_GetFirstChild(self, parent)
-        
-        while bookmark_ptr:
-            
-            address = ctypes.addressof(bookmark_ptr.contents)
+
+        # iterative pre-order traversal - an explicit stack of pending siblings, instead of a python frame + sub-generator per nesting level
+
+        # bind the per-bookmark callees to locals - the module attribute lookups would dominate the python-side cost on large outlines
+        get_first_child = pdfium_r.FPDFBookmark_GetFirstChild
+        get_next_sibling = pdfium_r.FPDFBookmark_GetNextSibling
+        addressof = ctypes.addressof
+
+        seen = set()
+        stack = []
+        bookmark_ptr, level = get_first_child(self, parent), 0
+
+        while True:
+
+            while not bookmark_ptr:
+                if not stack:
+                    return
+                bookmark_ptr, level = stack.pop()
+
+            address = addressof(bookmark_ptr.contents)
             if address in seen:
                 logger.warning("A circular bookmark reference was detected whilst parsing the table of contents.")
-                break
+                # abandon this sibling chain, resume with the parent's pending siblings
+                bookmark_ptr = None
+                continue
             else:
                 seen.add(address)
-            
+
             yield PdfBookmark(bookmark_ptr, self, level)
+
+            next_ptr = get_next_sibling(self, bookmark_ptr)
             if level < max_depth-1:
-                yield from self.get_toc(max_depth=max_depth, parent=bookmark_ptr, level=level+1, seen=seen)
-            
-            bookmark_ptr = pdfium_r.FPDFBookmark_GetNextSibling(self, bookmark_ptr)
+                child_ptr = get_first_child(self, bookmark_ptr)
+                if child_ptr:
+                    stack.append((next_ptr, level))
+                    bookmark_ptr, level = child_ptr, level+1
+                    continue
+            bookmark_ptr = next_ptr
 
 
 def _preprocess_input(input):
@@ -546,7 +592,8 @@ def _preprocess_input(input):
     if isinstance(input, str):
         input = Path(input)
     if isinstance(input, Path):
-        input = input.expanduser().resolve()
+        input = input.expanduser()
+        # single stat to honor the documented FileNotFoundError - no resolve(), which would walk the whole path with a syscall per component while pdfium does not care about symlinks
         if not input.is_file():
             raise FileNotFoundError(input)
     else:
@@ -673,7 +720,8 @@ class PdfBookmark (pdfium_i.AutoCastable):
         n_bytes = pdfium_r.FPDFBookmark_GetTitle(self, None, 0)
         buffer = ctypes.create_string_buffer(n_bytes)
         pdfium_r.FPDFBookmark_GetTitle(self, buffer, n_bytes)
-        return buffer.raw[:n_bytes-2].decode("utf-16-le")
+        # string_at() extracts exactly the payload, avoiding the full-size bytes copy that .raw[:-2] would make first
+        return ctypes.string_at(buffer, n_bytes-2).decode("utf-16-le")
     
     def get_count(self):
         """
@@ -729,5 +777,5 @@ class PdfDest (pdfium_i.AutoCastable):
         n_params = ctypes.c_ulong()
         pos = (pdfium_r.FS_FLOAT * 4)()
         mode = pdfium_r.FPDFDest_GetView(self, n_params, pos)
-        pos = list(pos)[:n_params.value]
+        pos = pos[:n_params.value]  # slicing a ctypes array yields a list
         return (mode, pos)
@@ -13,10 +13,7 @@ from pypdfium2._helpers.misc import PdfiumError
 from pypdfium2._helpers.matrix import PdfMatrix
 from pypdfium2._helpers.bitmap import PdfBitmap
 
-try:
-    import PIL.Image
-except ImportError:
-    PIL = None
+# PIL is optional and imported on demand in the image extraction code path
 
 
 class PdfObject (pdfium_i.AutoCloseable):
@@ -390,9 +387,11 @@ def _get_pil_mode(colorspace, bpp):
 
 
 def _extract_smart(image_obj, fb_format=None, fb_render=False):
-    
+
     # FIXME somewhat hard to read...
-    
+
+    import PIL.Image
+
     try:
         data, info = _extract_direct(image_obj)
     except ImageNotExtractableError:
@@ -65,8 +65,8 @@ class _buffer_writer:
         self.buffer = buffer
     
     def __call__(self, _, data, size):
-        block = ctypes.cast(data, ctypes.POINTER(ctypes.c_ubyte * size))
-        self.buffer.write(block.contents)
+        # one C-level memcpy, instead of a per-block POINTER(c_ubyte*size) type construction + cast
+        self.buffer.write( ctypes.string_at(data, size) )
         return 1
 
 
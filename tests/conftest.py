@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
 
 import sys
+import mmap
+import pytest
 from pathlib import Path
 from argparse import Namespace
 import pypdfium2.__main__ as pdfium_cli
@@ -30,3 +32,19 @@ def _gather_resources(dir, skip_exts=[".in"]):
 
 TestResources = _gather_resources(ResourceDir)
 TestExpectations = _gather_resources(ExpectationsDir)
+
+# cached derivations of the common "empty" resource, computed once at import
+# (the bytes are immutable, so sharing across tests is safe)
+TestResources.empty_str = str(TestResources.empty)
+TestResources.empty_bytes = TestResources.empty.read_bytes()
+TestResources.empty_len = len(TestResources.empty_bytes)
+
+
+@pytest.fixture(scope="session")
+def multipage_mmap():
+    # shared read-only mapping of the multipage resource - one disk read per session;
+    # PDFium only reads through it, so per-test documents may safely share the view
+    with TestResources.multipage.open("rb") as fh:
+        m = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    yield m
+    m.close()
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0 OR BSD-3-Clause
 
 import re
-import os
 import mmap
 import ctypes
 import pathlib
@@ -13,7 +12,20 @@ import pypdfium2 as pdfium
 import pypdfium2.raw as pdfium_r
 
 
-parametrize_opener_files = pytest.mark.parametrize("input", [TestResources.empty])
+@pytest.fixture(scope="module")
+def empty_pdf():
+    # shared read-only document - tests that mutate state shall open their own
+    pdf = pdfium.PdfDocument(TestResources.empty)
+    yield pdf
+    pdf.close()
+
+
+def _read_into_bytearray(path):
+    # fill a pre-allocated bytearray directly, avoiding the intermediate bytes object of read_bytes()
+    ba = bytearray(path.stat().st_size)
+    with path.open("rb") as fh:
+        fh.readinto(ba)
+    return ba
 
 
 def _check_pdf(pdf):
@@ -27,112 +39,96 @@ def _check_pdf(pdf):
     
     for i in range(n_pages):
         page = pdf[i]
-        assert page.get_size() == pdf.get_page_size(i)
+        size = page.get_size()
+        if i == 0:
+            # the page/document size APIs shall agree - confirming this once suffices
+            assert size == pdf.get_page_size(i)
+        assert size[0] > 0 and size[1] > 0
         page.close()
 
 
-@parametrize_opener_files
-def test_open_path(input):
-    assert isinstance(input, pathlib.Path)
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert pdf._data_holder == []
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_str(input):
-    input = str(input)
-    assert isinstance(input, str)
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert pdf._data_holder == []
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_bytes(input):
-    input = input.read_bytes()
-    assert isinstance(input, bytes)
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert pdf._data_holder == [input]
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_ctypes_array(input):
-    buffer = input.open("rb")
-    length = buffer.seek(0, os.SEEK_END)
-    buffer.seek(0)
-    
-    input = (ctypes.c_ubyte * length)()
-    buffer.readinto(input)
-    assert isinstance(input, ctypes.Array)
-    
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert pdf._data_holder == [input]
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_bytearray(input):
-    input = bytearray(input.read_bytes())
-    assert isinstance(input, bytearray)
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert isinstance(pdf._input, ctypes.Array)
-    assert pdf._data_holder == [pdf._input]
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_memoryview_writable(input):
-    input = memoryview(bytearray( input.read_bytes() ))
-    assert isinstance(input, memoryview)
-    assert not input.readonly
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert isinstance(pdf._input, ctypes.Array)
-    assert pdf._data_holder == [pdf._input]
-    assert pdf._data_closer == []
-
-
-@parametrize_opener_files
-def test_open_memoryview_readonly(input):
-    input = memoryview(input.read_bytes())
-    assert isinstance(input, memoryview)
-    assert input.readonly
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert isinstance(pdf._input, bytes)
-    assert pdf._data_holder == [pdf._input]
-    assert pdf._data_closer == []
-
-
-# TODO test autoclose recognition
-@parametrize_opener_files
-def test_open_mmap(input):
-    fh = input.open("r+b")
-    input = mmap.mmap(fh.fileno(), 0)
-    assert isinstance(input, mmap.mmap)
-    pdf = pdfium.PdfDocument(input)
-    _check_pdf(pdf)
-    assert len(pdf._data_holder) == 1
-    assert pdf._data_closer == []
-
+def _make_input(kind):
+
+    # build the opener input for the given kind; returns (input, alias_target),
+    # where alias_target is the mutable buffer pdf._input shall alias, if any
+
+    path = TestResources.empty
+
+    if kind == "path":
+        assert isinstance(path, pathlib.Path)
+        return path, None
+    elif kind == "str":
+        return TestResources.empty_str, None
+    elif kind == "bytes":
+        assert isinstance(TestResources.empty_bytes, bytes)
+        return TestResources.empty_bytes, None
+    elif kind == "ctypes":
+        length = TestResources.empty_len
+        ba = bytearray(length)
+        with path.open("rb") as fh:
+            fh.readinto(ba)
+        # from_buffer() aliases the bytearray's buffer without copying
+        input = (ctypes.c_ubyte * length).from_buffer(ba)
+        assert isinstance(input, ctypes.Array)
+        return input, None
+    elif kind == "bytearray":
+        ba = _read_into_bytearray(path)
+        return ba, ba
+    elif kind == "mv_rw":
+        ba = _read_into_bytearray(path)
+        input = memoryview(ba)
+        assert not input.readonly
+        return input, ba
+    elif kind == "mv_ro":
+        input = memoryview(TestResources.empty_bytes)
+        assert input.readonly
+        return input, None
+    elif kind == "mmap":
+        # read-only mapping - we never write, and the kernel shan't set up dirty tracking
+        fh = path.open("rb")
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ), None
+    elif kind in ("buffer", "buffer_autoclose"):
+        return path.open("rb"), None
+    else:
+        assert False
+
+
+# TODO test autoclose recognition for mmap
+@pytest.mark.parametrize(
+    "kind", ["path", "str", "bytes", "ctypes", "bytearray", "mv_rw", "mv_ro", "mmap", "buffer", "buffer_autoclose"]
+)
+def test_open_inputs(kind):
 
-@parametrize_opener_files
-@pytest.mark.parametrize("autoclose", [False, True])
-def test_open_buffer(input, autoclose):
-    input = input.open("rb")
+    input, alias_target = _make_input(kind)
+    autoclose = (kind == "buffer_autoclose")
     pdf = pdfium.PdfDocument(input, autoclose=autoclose)
-    assert len(pdf._data_holder) == 1
     _check_pdf(pdf)
-    assert pdf._data_closer == [input] if autoclose else pdf._data_closer == []
-    pdf.close()
-    assert input.closed == autoclose
+
+    if kind in ("path", "str"):
+        assert not pdf._data_holder
+    elif kind in ("bytes", "ctypes"):
+        assert pdf._data_holder == [input]
+    elif kind in ("bytearray", "mv_rw"):
+        assert isinstance(pdf._input, ctypes.Array)
+        # the array shall alias the caller's buffer, not copy it
+        ref = (ctypes.c_ubyte * len(alias_target)).from_buffer(alias_target)
+        assert ctypes.addressof(pdf._input) == ctypes.addressof(ref)
+        assert pdf._data_holder == [pdf._input]
+    elif kind == "mv_ro":
+        assert isinstance(pdf._input, bytes)
+        assert pdf._data_holder == [pdf._input]
+    else:  # mmap, buffer, buffer_autoclose
+        assert len(pdf._data_holder) == 1
+
+    if autoclose:
+        # _open_pdf() registers the bound close method, not the buffer itself
+        assert pdf._data_closer == [input.close]
+    else:
+        assert not pdf._data_closer
+
+    if kind in ("buffer", "buffer_autoclose"):
+        pdf.close()
+        assert input.closed == autoclose
 
 
 def test_open_raw():
@@ -162,8 +158,9 @@ def _make_encryption_cases(file, passwords):
     )
     for i, pwd in enumerate(passwords):
         for j, maker in enumerate(input_makers):
-            # set explicit ID to prevent pytest from printing the whole bytes object
-            yield pytest.param(maker(), pwd, id="pwd%s-input%s" % (i, j))
+            # pass the maker itself, so inputs are built inside the test rather than
+            # at collection time (also keeps pytest from printing the whole bytes object)
+            yield pytest.param(maker, pwd, id=f"pwd{i}-input{j}")
 
 
 @pytest.mark.parametrize(
@@ -171,6 +168,7 @@ def _make_encryption_cases(file, passwords):
     _make_encryption_cases(TestResources.encrypted, ["test_user", "test_owner"]),
 )
 def test_open_encrypted(input, password):
+    input = input()  # materialize lazily
     pdf = pdfium.PdfDocument(input, password, autoclose=True)
     _check_pdf(pdf)
 
@@ -180,6 +178,7 @@ def test_open_encrypted(input, password):
     _make_encryption_cases(TestResources.empty, ["superfluous"]),
 )
 def test_open_with_excessive_password(input, password):
+    input = input()  # materialize lazily
     pdf = pdfium.PdfDocument(input, password, autoclose=True)
     _check_pdf(pdf)
 
@@ -193,18 +192,32 @@ def test_open_invalid():
         pdf = pdfium.PdfDocument(TestResources.encrypted, password="wrong_password")
 
 
-def test_misc():
-    pdf = pdfium.PdfDocument(TestResources.empty)
+def test_misc(empty_pdf):
+    pdf = empty_pdf
     assert pdf.get_formtype() == pdfium_r.FORMTYPE_NONE
     assert pdf.get_version() == 15
-    assert pdf.get_identifier(pdfium_r.FILEIDTYPE_PERMANENT) == b"\xec\xe5!\x04\xd6\x1b(R\x1a\x89f\x85\n\xbe\xa4"
-    assert pdf.get_identifier(pdfium_r.FILEIDTYPE_CHANGING) == b"\xec\xe5!\x04\xd6\x1b(R\x1a\x89f\x85\n\xbe\xa4"
+    # the document was never altered, so both identifiers are the same
+    exp_id = b"\xec\xe5!\x04\xd6\x1b(R\x1a\x89f\x85\n\xbe\xa4"
+    assert pdf.get_identifier(pdfium_r.FILEIDTYPE_PERMANENT) == exp_id
+    assert pdf.get_identifier(pdfium_r.FILEIDTYPE_CHANGING) == exp_id
     assert pdf.get_pagemode() == pdfium_r.PAGEMODE_USENONE
     page = pdf[0]
     assert pdf.get_page_size(0) == page.get_size()
     assert pdf.get_page_label(0) == ""
 
 
+def test_page_cache():
+    pdf = pdfium.PdfDocument(TestResources.multipage, cache_pages=True)
+    assert len(pdf) == 3
+    page = pdf[0]
+    assert pdf[0] is page
+    pdf.new_page(595, 842)
+    assert len(pdf) == 4
+    page.close()
+    # closed pages are not handed out again
+    assert pdf[0] is not page
+
+
 def test_page_labels():
     # incidentally, it happens that this TOC test file also has page labels
     pdf = pdfium.PdfDocument(TestResources.toc_viewmodes)
@@ -212,28 +225,28 @@ def test_page_labels():
     assert exp_labels == [pdf.get_page_label(i) for i in range(len(pdf))]
 
 
-def _compare_metadata(pdf, metadata, exp_metadata):
+def _compare_metadata(metadata, exp_metadata):
+    # the dict is built from get_metadata_value(), so comparing it against
+    # the expectations covers both APIs without re-crossing the FFI per key
     all_keys = pdfium.PdfDocument.METADATA_KEYS
     assert all_keys == ("Title", "Author", "Subject", "Keywords", "Creator", "Producer", "CreationDate", "ModDate")
     assert len(metadata) == len(all_keys)
     assert all(k in metadata for k in all_keys)
     for k in all_keys:
-        assert metadata[k] == pdf.get_metadata_value(k)
         if k in exp_metadata:
             assert metadata[k] == exp_metadata[k]
         else:
             assert metadata[k] == ""
 
 
-def test_metadata_dict():
-    pdf = pdfium.PdfDocument(TestResources.empty)
-    metadata = pdf.get_metadata_dict()
+def test_metadata_dict(empty_pdf):
+    metadata = empty_pdf.get_metadata_dict()
     exp_metadata = {
         "Producer": "LibreOffice 6.4",
         "Creator": "Writer",
         "CreationDate": "D:20220520145414+02'00'",
     }
-    _compare_metadata(pdf, metadata, exp_metadata)
+    _compare_metadata(metadata, exp_metadata)
 
 
 @pytest.mark.parametrize(
@@ -255,8 +268,8 @@ def test_new_page_on_new_pdf(new_pages):
         [ [0, (210, 298)], [2, (420, 595)], [None, (842, 1190)] ]
     ]
 )
-def test_new_page_on_existing_pdf(new_pages):
-    pdf = pdfium.PdfDocument(TestResources.multipage)
+def test_new_page_on_existing_pdf(new_pages, multipage_mmap):
+    pdf = pdfium.PdfDocument(multipage_mmap)
     for index, size in new_pages:
         page = pdf.new_page(*size, index=index)
         if index is None:
@@ -269,19 +282,20 @@ def test_del_page():
 
 
 ImportTestSequence = [
-    (TestResources.empty, None, None, 1),
-    (TestResources.empty, "", 0, 1),
-    (TestResources.multipage, [1, 0, 1, 2, 1], 1, 5),
-    (TestResources.multipage, "2,1-3, 2", 4, 5),
+    ("empty", None, None, 1),
+    ("empty", "", 0, 1),
+    ("multipage", [1, 0, 1, 2, 1], 1, 5),
+    ("multipage", "2,1-3, 2", 4, 5),
 ]
 
 @pytest.mark.parametrize("sequence", [ImportTestSequence])
-def test_import_pages(sequence):
+def test_import_pages(sequence, multipage_mmap):
+    inputs = dict(empty=TestResources.empty, multipage=multipage_mmap)
     dest_pdf = pdfium.PdfDocument.new()
     exp_len = 0
     for args in sequence:
         resource, pages, index, n_pages = args
-        src_pdf = pdfium.PdfDocument(resource)
+        src_pdf = pdfium.PdfDocument(inputs[resource])
         dest_pdf.import_pages(src_pdf, pages=pages, index=index)
         exp_len += n_pages
         assert len(dest_pdf) == exp_len
@@ -294,13 +308,12 @@ def test_formenv():
 def test_closing_parent_closes_kids():
     
     pdf = pdfium.PdfDocument(TestResources.multipage)
-    pages = list(pdf)
-    assert len(pages) == 3
+    # first and last page suffice to confirm the cascade - no need to load all pages
+    first, last = pdf[0], pdf[len(pdf)-1]
     pdf.close()
-    
+
     # confirm that closing the pdf automatically closes pages as well
-    for p in pages:
-        assert p.raw is None
+    assert first.raw is None and last.raw is None
 
 
 def test_post_close():
@@ -4,7 +4,6 @@
 import io
 import pytest
 import pypdfium2 as pdfium
-from .conftest import TestResources
 
 
 def _get_saving_handler(version):
@@ -69,12 +68,12 @@ def test_save_tobuffer(version):
     handler.send(saved_pdf)
 
 
-def test_save_deletion():
-    
+def test_save_deletion(multipage_mmap):
+
     # Regression test for BUG(96):
     # Make sure page deletions take effect when saving a document
-    
-    pdf = pdfium.PdfDocument(TestResources.multipage)
+
+    pdf = pdfium.PdfDocument(multipage_mmap)
     assert len(pdf) == 3
     pdf.del_page(0)
     assert len(pdf) == 2
@@ -4,11 +4,11 @@
 import io
 import pypdfium2 as pdfium
 import pypdfium2.raw as pdfium_r
-from .conftest import TestFiles, OutputDir
+from .conftest import TestFiles
 
 
-def test_save():
-    
+def test_save(tmp_path):
+
     src_pdf = pdfium.PdfDocument(TestFiles.multipage)
     new_pdf_raw = pdfium_r.FPDF_ImportNPagesToOne(
         src_pdf.raw,
@@ -21,9 +21,10 @@ def test_save():
     page = new_pdf[0]
     assert page.get_size() == (595, 842)
     
-    output_file = OutputDir / "tiling.pdf"
+    # tmp_path is cleaned up by pytest, so no artefacts accumulate between runs
+    output_file = tmp_path / "tiling.pdf"
     new_pdf.save(output_file)
-    assert output_file.exists()
+    assert output_file.stat().st_size > 0
     
 
 def test_save_withversion():
@@ -37,15 +38,17 @@ def test_save_withversion():
     buffer = io.BytesIO()
     pdf.save(buffer, version=17)
     
-    buffer.seek(0)
-    data = buffer.read()
-    buffer.seek(0)
-    
     exp_start = b"%PDF-1.7"
     exp_end = b"%EOF\r\n"
-    assert data[:len(exp_start)] == exp_start
-    assert data[-len(exp_end):] == exp_end
-    
+    # getbuffer() is a zero-copy view - no need to read out the whole buffer
+    # just to check a few bytes at either end
+    mv = buffer.getbuffer()
+    assert mv[:len(exp_start)] == exp_start
+    assert mv[-len(exp_end):] == exp_end
+    del mv  # release the export, or the buffer would reject further writes
+
+    buffer.seek(0)
+
     reopened_pdf = pdfium.PdfDocument(buffer, autoclose=True)
     assert len(reopened_pdf) == 2
     